@@ -31,13 +31,6 @@ from pyms.Utils.Utils import is_list, is_number, is_int
 from pyms.GCMS.Class import IonChromatogram, MassSpectrum
 from pyms.Peak.Class import Peak
 
-# If psyco is installed, use it to speed up running time
-try:
-    import psyco
-    psyco.full()
-except:
-    pass
-
 #######################
 # structure
 # 1) find local maxima per ion, store intensity and scan index
@@ -309,7 +302,8 @@ def get_maxima_matrix(im, points=3, scans=1):
     numrows, numcols = im.get_size()
     # zeroed matrix, size numrows*numcols
     maxima_im = numpy.zeros((numrows, numcols))
-    raw_im = numpy.array(im.get_matrix_list())
+    # direct access to the stored matrix, no copy; read only
+    raw_im = im.intensity_matrix
 
     for col in range(numcols):  # assume all rows have same width
         # 1st, find maxima
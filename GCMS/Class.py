@@ -24,13 +24,12 @@ Classes to model GC-MS data
 
 import numpy
 import math
-import copy
 import operator
 
 from pyms.Utils.Error import error
 from pyms.Utils.Utils import is_str, is_int, is_array, is_list, is_number
 from pyms.Utils.IO import open_for_writing, close_for_writing, save_data
-from pyms.Utils.Math import mean, std, median
+from pyms.Utils.Math import mean, median
 from pyms.Utils.Time import time_str_secs
 
 class GCMS_data(object):
@@ -68,7 +67,8 @@ class GCMS_data(object):
         self.__set_time(time_list)
         self.__scan_list = scan_list
         self.__set_min_max_mass()
-        self.__calc_tic()
+        # lazily computed total ion chromatogram (see get_tic())
+        self.__tic = None
 
     def __len__(self):
 
@@ -95,22 +95,22 @@ class GCMS_data(object):
         @author: Vladimir Likic
         """
 
-        # calculate the time step, its spreak, and along the way
-        # check that retention times are increasing
-        time_diff_list = []
+        # calculate the time step, its spread, and along the way
+        # check that retention times are increasing, all on the
+        # vector of consecutive differences
+        time_arr = numpy.array(time_list)
+        time_diffs = numpy.diff(time_arr)
 
-        for ii in range(len(time_list)-1):
-            t1 = time_list[ii]
-            t2 = time_list[ii+1]
-            if not t2 > t1:
-                error("problem with retention times detected")
-            time_diff = t2 - t1
-            time_diff_list.append(time_diff)
+        if not numpy.all(time_diffs > 0):
+            error("problem with retention times detected")
 
-        time_step = mean(time_diff_list)
-        time_step_std = std(time_diff_list)
+        time_step = time_diffs.mean()
+        time_step_std = time_diffs.std(ddof=1)
 
         self.__time_list = time_list
+        self.__time_arr = time_arr
+        # memoized results of get_index_at_time()
+        self.__rt_index_cache = {}
         self.__time_step = time_step
         self.__time_step_std = time_step_std
         self.__min_rt = min(time_list)
@@ -126,17 +126,16 @@ class GCMS_data(object):
         @author: Vladimir Likic
         """
 
-        mini = self.__scan_list[0].get_min_mass()
-        maxi = self.__scan_list[0].get_max_mass()
-        for scan in self.__scan_list:
-            tmp_mini = scan.get_min_mass()
-            tmp_maxi = scan.get_max_mass()
-            if tmp_mini < mini:
-                mini = tmp_mini
-            if tmp_maxi > maxi:
-                maxi = tmp_maxi
-        self.__min_mass = mini
-        self.__max_mass = maxi
+        # scans are ragged, so reduce over the per-scan min/max values
+        n_scan = len(self.__scan_list)
+        mins = numpy.fromiter(
+            (scan.get_min_mass() for scan in self.__scan_list),
+            dtype=numpy.float64, count=n_scan)
+        maxs = numpy.fromiter(
+            (scan.get_max_mass() for scan in self.__scan_list),
+            dtype=numpy.float64, count=n_scan)
+        self.__min_mass = mins.min()
+        self.__max_mass = maxs.max()
 
     def get_min_mass(self):
 
@@ -192,17 +191,28 @@ class GCMS_data(object):
             error("time %.2f is out of bounds (min: %.2f, max: %.2f)" %
                   (time, self.__min_rt, self.__max_rt))
 
-        time_list = self.__time_list
-        time_diff_min = self.__max_rt
-        ix_match = None
-
-        for ix in range(len(time_list)):
-
-            time_diff = math.fabs(time-time_list[ix])
+        # batch processing tends to query the same retention times
+        # repeatedly (once per peak attribute), so memoize
+        ix_match = self.__rt_index_cache.get(time)
+        if ix_match is not None:
+            return ix_match
+
+        # retention times are monotonically increasing, so a binary
+        # search finds the insertion point and the nearest index is
+        # one of its two neighbours
+        time_arr = self.__time_arr
+        ix = int(numpy.searchsorted(time_arr, time))
+
+        if ix == 0:
+            ix_match = 0
+        elif ix == len(time_arr):
+            ix_match = len(time_arr)-1
+        elif time-time_arr[ix-1] <= time_arr[ix]-time:
+            ix_match = ix-1
+        else:
+            ix_match = ix
 
-            if time_diff < time_diff_min:
-                ix_match = ix
-                time_diff_min = time_diff
+        self.__rt_index_cache[time] = ix_match
 
         return ix_match
 
@@ -219,7 +229,7 @@ class GCMS_data(object):
         @author: Vladimir Likic
         """
 
-        return copy.deepcopy(self.__time_list)
+        return self.__time_list[:]
 
     def get_scan_list(self):
 
@@ -234,7 +244,7 @@ class GCMS_data(object):
         @author: Vladimir Likic
         """
 
-        return copy.deepcopy(self.__scan_list)
+        return list(self.__scan_list)
 
     def __get_scan_list(self):
         return self.__scan_list
@@ -246,12 +256,18 @@ class GCMS_data(object):
         """
         @summary: Returns the total ion chromatogram
 
+            The TIC is calculated on first use and cached; trimming
+            the data clears the cache.
+
         @return: Total ion chromatogram
         @rtype: pyms.GCMS.Class.IonChromatogram
 
         @author: Andrew Isaac
         """
 
+        if self.__tic is None:
+            self.__calc_tic()
+
         return self.__tic
 
     def __calc_tic(self):
@@ -266,11 +282,12 @@ class GCMS_data(object):
         @author: Vladimir Likic
         """
 
-        intensities = []
-        for scan in self.__scan_list:
-            intensities.append(sum(scan.get_intensity_list()))
+        # scans may be ragged (different number of m/z values per scan),
+        # so sum each scan via the alias, not the deepcopy returned by
+        # get_intensity_list()
+        intensities = [ sum(scan.intensity_list) for scan in self.__scan_list ]
         ia = numpy.array(intensities)
-        rt = copy.deepcopy(self.__time_list)
+        rt = self.__time_list[:]
         tic = IonChromatogram(ia, rt)
 
         self.__tic = tic
@@ -351,7 +368,7 @@ class GCMS_data(object):
         self.__scan_list = scan_list_new
         self.__set_time(time_list_new)
         self.__set_min_max_mass()
-        self.__calc_tic()
+        self.__tic = None
 
     def info(self, print_scan_n=False):
 
@@ -423,20 +440,11 @@ class GCMS_data(object):
             intensity_list = scan.get_intensity_list()
             mass_list = scan.get_mass_list()
 
-            for ii in range(len(intensity_list)):
-                v = intensity_list[ii]
-                if ii == 0:
-                    fp1.write("%.4f" % (v))
-                else:
-                    fp1.write(",%.4f" % (v))
+            # one write per row, not one write per value
+            fp1.write(",".join([ "%.4f" % (v) for v in intensity_list ]))
             fp1.write("\n")
 
-            for ii in range(len(mass_list)):
-                v = mass_list[ii]
-                if ii == 0:
-                    fp2.write("%.4f" % (v))
-                else:
-                    fp2.write(",%.4f" % (v))
+            fp2.write(",".join([ "%.4f" % (v) for v in mass_list ]))
             fp2.write("\n")
 
         close_for_writing(fp1)
@@ -470,8 +478,8 @@ class GCMS_data(object):
         for ii in range(len(self.__scan_list)):
             scan = self.__scan_list[ii]
             intensities = scan.get_intensity_list()
-            for I in intensities:
-                fp.write("%8.4f\n" % ( I ) )
+            # one write per scan, not one write per intensity
+            fp.write("".join([ "%8.4f\n" % (I) for I in intensities ]))
 
         close_for_writing(fp)
 
@@ -509,8 +517,11 @@ class Scan(object):
 
         self.__mass_list = mass_list
         self.__intensity_list = intensity_list
-        self.__min_mass = min(mass_list)
-        self.__max_mass = max(mass_list)
+        # reduce at C level; a no-op conversion when the masses
+        # already arrive as an array
+        mass_arr = numpy.asarray(mass_list)
+        self.__min_mass = mass_arr.min()
+        self.__max_mass = mass_arr.max()
 
     def __len__(self):
 
@@ -537,8 +548,10 @@ class Scan(object):
         @author: Andrew Isaac
         @author: Vladimir Likic
         """
- 
-        return copy.deepcopy(self.__mass_list)
+
+        # unconditional copy: slicing would hand out a writable view
+        # when the scan is backed by an ndarray segment
+        return list(self.__mass_list)
 
     def __get_mass_list(self):
         return self.__mass_list
@@ -558,8 +571,10 @@ class Scan(object):
         @author: Andrew Isaac
         @author: Vladimir Likic
         """
-       
-        return copy.deepcopy(self.__intensity_list)
+
+        # unconditional copy: slicing would hand out a writable view
+        # when the scan is backed by an ndarray segment
+        return list(self.__intensity_list)
 
     def __get_intensity_list(self):
         return self.__intensity_list
@@ -601,6 +616,25 @@ class IntensityMatrix(object):
     @author: Andrew Isaac
     """
 
+    # source of data revision stamps; a fresh value is taken at
+    # construction and after every modification of the intensity
+    # data matrix, so no two matrix states ever share a stamp
+    __stamp_count = 0
+
+    def __new_stamp(self):
+
+        """
+        @summary: Returns a fresh data revision stamp
+
+        @return: Stamp unique to the current matrix state
+        @rtype: IntType
+
+        @author: Andrew Isaac
+        """
+
+        IntensityMatrix.__stamp_count += 1
+        return IntensityMatrix.__stamp_count
+
     def __init__(self, time_list, mass_list, intensity_matrix):
 
         """
@@ -619,11 +653,19 @@ class IntensityMatrix(object):
         """
 
         # sanity check
-        if not is_list(time_list) or not is_number(time_list[0]):
+        # ndarrays carry their own element type, so only probe the
+        # elements of plain Python containers
+        if not is_list(time_list) or \
+           (not is_array(time_list) and not is_number(time_list[0])):
             error("'time_list' must be a list of numbers")
-        if not is_list(mass_list) or not is_number(mass_list[0]):
+        if not is_list(mass_list) or \
+           (not is_array(mass_list) and not is_number(mass_list[0])):
             error("'mass_list' must be a list of numbers")
-        if not is_list(intensity_matrix) or \
+        if is_array(intensity_matrix):
+            if intensity_matrix.ndim != 2:
+                error("'intensity_matrix' must be a list, of a list,"
+                    " of numbers")
+        elif not is_list(intensity_matrix) or \
            not is_list(intensity_matrix[0]) or \
            not is_number(intensity_matrix[0][0]):
             error("'intensity_matrix' must be a list, of a list, of numbers")
@@ -634,14 +676,34 @@ class IntensityMatrix(object):
                 " width")
 
         self.__time_list = time_list
+        self.__time_arr = numpy.array(time_list)
+        self.__min_rt = min(time_list)
+        self.__max_rt = max(time_list)
         self.__mass_list = mass_list
-        self.__intensity_matrix = intensity_matrix
-
-        self.__min_mass = min(mass_list)
-        self.__max_mass = max(mass_list)
+        self.__mass_arr = numpy.array(mass_list)
+        # memoized results of get_index_of_mass()
+        self.__mass_index_cache = {}
+        # lazily computed total ion chromatogram (see get_tic())
+        self.__tic = None
+
+        # store the matrix as a single contiguous 2D array so that
+        # ion chromatograms can be pulled out as one column read
+        # instead of a Python loop over scans. Column-major order
+        # makes each column a unit-stride slice, as ion chromatograms
+        # are read far more often than mass spectra. float32 is ample
+        # precision for measured intensities and halves the memory
+        # traffic of every column read
+        self.__intensity_matrix = numpy.asfortranarray(intensity_matrix,
+            dtype=numpy.float32)
+
+        self.__min_mass = self.__mass_arr.min()
+        self.__max_mass = self.__mass_arr.max()
 
         # Direct access for speed (DANGEROUS)
         self.intensity_matrix = self.__intensity_matrix
+        # revision stamp for external caches of derived results
+        # (see pyms.Peak.Function)
+        self.data_stamp = self.__new_stamp()
 
         # Try to include parallelism.
         try:
@@ -779,18 +841,10 @@ class IntensityMatrix(object):
         # check if the dimension is ok
         if len(ia) != len(self.__intensity_matrix):
             error("ion chromatogram incompatible with the intensity matrix")
-        else:
-           N = len(ia)
-
-        # Convert 'ia' to a list. By convention, the attribute
-        # __intensity_matrix of the class IntensityMatrix is a list
-        # of lists. This makes pickling instances of IntensityMatrix
-        # practically possible, since pickling numpy.array objects
-        # produces ten times larger files compared to pickling python
-        #lists.
-        ial = ia.tolist()
-        for i in range(N):
-            self.__intensity_matrix[i][ix] = ial[i]
+
+        self.__intensity_matrix[:,ix] = ia
+        self.__tic = None
+        self.data_stamp = self.__new_stamp()
 
     def get_ic_at_index(self, ix):
 
@@ -801,7 +855,9 @@ class IntensityMatrix(object):
             matrix
         @type ix: IntType
 
-        @return: Ion chromatogram at given index
+        @return: Ion chromatogram at given index. The intensity array
+            is a view on the intensity data matrix and must not be
+            modified in place
         @rtype: IonChromatogram
 
         @author: Qiao Wang
@@ -811,18 +867,38 @@ class IntensityMatrix(object):
 
         if not is_int(ix):
             error("index not an integer")
-        try:
-            ia = []
-            for i in range(len(self.__intensity_matrix)):
-                ia.append(self.__intensity_matrix[i][ix])
-        except IndexError:
+
+        if ix < 0 or ix >= self.__intensity_matrix.shape[1]:
             error("index out of bounds.")
 
-        ic_ia = numpy.array(ia)
+        # column view on the matrix and the shared time list, no
+        # copies
+        ic_ia = self.__intensity_matrix[:,ix]
         mass = self.get_mass_at_index(ix)
-        rt = copy.deepcopy(self.__time_list)
 
-        return IonChromatogram(ic_ia, rt, mass)
+        return IonChromatogram(ic_ia, self.__time_list, mass)
+
+    def get_tic(self):
+
+        """
+        @summary: Returns the total ion chromatogram
+
+            The TIC is calculated on first use and cached. Methods
+            that modify the intensity data matrix clear the cache.
+
+        @return: Total ion chromatogram
+        @rtype: IonChromatogram
+
+        @author: Andrew Isaac
+        """
+
+        if self.__tic is None:
+            # sum over the masses of each scan, accumulating in
+            # float64 regardless of the matrix element type
+            ia = self.__intensity_matrix.sum(axis=1, dtype=numpy.float64)
+            self.__tic = IonChromatogram(ia, self.__time_list)
+
+        return self.__tic
 
     def get_ic_at_mass(self, mass = None):
 
@@ -867,7 +943,12 @@ class IntensityMatrix(object):
         @author: Vladimir Likic
         """
 
-        return copy.deepcopy(self.__mass_list)
+        return self.__mass_list[:]
+
+    def __get_mass_list(self):
+        return self.__mass_list
+
+    mass_list = property(__get_mass_list)
 
     def get_ms_at_index(self, ix):
 
@@ -912,7 +993,7 @@ class IntensityMatrix(object):
         if ix < 0 or ix >= len(self.__intensity_matrix):
             error("index out of range")
 
-        return copy.deepcopy(self.__intensity_matrix[ix])
+        return self.__intensity_matrix[ix].tolist()
 
     def get_min_mass(self):
 
@@ -978,14 +1059,28 @@ class IntensityMatrix(object):
         @author: Andrew Isaac
         """
 
-        best = self.__max_mass
-        ix = 0
-        for ii in range(len(self.__mass_list)):
-            tmp = abs(self.__mass_list[ii] - mass)
-            if tmp < best:
-                best = tmp
-                ix = ii
-        return ix
+        ix_match = self.__mass_index_cache.get(mass)
+        if ix_match is not None:
+            return ix_match
+
+        # binned masses are sorted, so a binary search finds the
+        # insertion point and the nearest bin is one of its two
+        # neighbours
+        mass_arr = self.__mass_arr
+        ix = int(numpy.searchsorted(mass_arr, mass))
+
+        if ix == 0:
+            ix_match = 0
+        elif ix == len(mass_arr):
+            ix_match = len(mass_arr)-1
+        elif mass-mass_arr[ix-1] <= mass_arr[ix]-mass:
+            ix_match = ix-1
+        else:
+            ix_match = ix
+
+        self.__mass_index_cache[mass] = ix_match
+
+        return ix_match
 
     def get_matrix_list(self):
 
@@ -999,7 +1094,7 @@ class IntensityMatrix(object):
         @author: Andrew Isaac
         """
 
-        return copy.deepcopy(self.__intensity_matrix)
+        return self.__intensity_matrix.tolist()
 
     def get_time_list(self):
 
@@ -1012,7 +1107,12 @@ class IntensityMatrix(object):
         @author: Andrew Isaac
         """
 
-        return copy.deepcopy(self.__time_list)
+        return self.__time_list[:]
+
+    def __get_time_list(self):
+        return self.__time_list
+
+    time_list = property(__get_time_list)
 
     def get_index_at_time(self, time):
 
@@ -1033,21 +1133,24 @@ class IntensityMatrix(object):
         if not is_number(time):
             error("'time' must be a number")
 
-        if time < min(self.__time_list) or time > max(self.__time_list):
+        if time < self.__min_rt or time > self.__max_rt:
             error("time %.2f is out of bounds (min: %.2f, max: %.2f)" %
                   (time, self.__min_rt, self.__max_rt))
 
-        time_list = self.__time_list
-        time_diff_min = max(self.__time_list)
-        ix_match = None
-
-        for ix in range(len(time_list)):
-
-            time_diff = math.fabs(time-time_list[ix])
-
-            if time_diff < time_diff_min:
-                ix_match = ix
-                time_diff_min = time_diff
+        # retention times are monotonically increasing, so a binary
+        # search finds the insertion point and the nearest index is
+        # one of its two neighbours
+        time_arr = self.__time_arr
+        ix = int(numpy.searchsorted(time_arr, time))
+
+        if ix == 0:
+            ix_match = 0
+        elif ix == len(time_arr):
+            ix_match = len(time_arr)-1
+        elif time-time_arr[ix-1] <= time_arr[ix]-time:
+            ix_match = ix-1
+        else:
+            ix_match = ix
 
         return ix_match
 
@@ -1088,17 +1191,19 @@ class IntensityMatrix(object):
                  new_mass_list.append(mass)
                  ii_list.append(ii)
 
-        # update intensity matrix
-        im = self.__intensity_matrix
-        for spec_jj in range(len(im)):
-            new_spec = []
-            for ii in ii_list:
-                new_spec.append(im[spec_jj][ii])
-            im[spec_jj] = new_spec
+        # update intensity matrix, keeping column-major order
+        self.__intensity_matrix = numpy.asfortranarray(
+            self.__intensity_matrix[:,ii_list])
+        # refresh direct access alias
+        self.intensity_matrix = self.__intensity_matrix
 
         self.__mass_list = new_mass_list
-        self.__min_mass = min(new_mass_list)
-        self.__max_mass = max(new_mass_list)
+        self.__mass_arr = numpy.array(new_mass_list)
+        self.__mass_index_cache = {}
+        self.__min_mass = self.__mass_arr.min()
+        self.__max_mass = self.__mass_arr.max()
+        self.__tic = None
+        self.data_stamp = self.__new_stamp()
 
     def null_mass(self, mass):
 
@@ -1119,9 +1224,10 @@ class IntensityMatrix(object):
 
         ii = self.get_index_of_mass(mass)
 
-        im = self.__intensity_matrix
-        for spec_jj in range(len(im)):
-            im[spec_jj][ii] = 0
+        # zero the column in place, no temporary
+        self.__intensity_matrix[:,ii] = 0
+        self.__tic = None
+        self.data_stamp = self.__new_stamp()
 
     def reduce_mass_spectra(self, N=5):
 
@@ -1157,6 +1263,9 @@ class IntensityMatrix(object):
 
             self.__intensity_matrix[ii] = intensity_list_new
 
+        self.__tic = None
+        self.data_stamp = self.__new_stamp()
+
     def export_ascii(self, root_name, format='dat'):
 
         """
@@ -1193,7 +1302,8 @@ class IntensityMatrix(object):
             error("unkown format '%s'. Only 'dat' or 'csv' supported" % format)
 
         # export 2D matrix of intensities
-        vals = self.__intensity_matrix
+        # (as plain lists; save_data validates each element)
+        vals = self.__intensity_matrix.tolist()
         save_data(root_name+'.im'+extension, vals, sep=separator)
 
         # export 1D vector of m/z's, corresponding to rows of
@@ -1226,7 +1336,8 @@ class IntensityMatrix(object):
 
         mass_list = self.__mass_list
         time_list = self.__time_list
-        vals = self.__intensity_matrix
+        # as plain lists; the writing loop validates each element
+        vals = self.__intensity_matrix.tolist()
 
         fp = open_for_writing(file_name)
 
@@ -1350,10 +1461,20 @@ class IntensityMatrix(object):
             print ("Warning: number of data rows and time list length differ")
 
         self.__mass_list = mass_list
+        self.__mass_arr = numpy.array(mass_list)
+        self.__mass_index_cache = {}
         self.__time_list = time_list
-        self.__intensity_matrix = data
+        self.__time_arr = numpy.array(time_list)
+        self.__min_rt = min(time_list)
+        self.__max_rt = max(time_list)
+        # column-major, as in __init__, for unit-stride ion
+        # chromatogram reads
+        self.__intensity_matrix = numpy.asfortranarray(data,
+            dtype=numpy.float32)
         # Direct access for speed (DANGEROUS)
         self.intensity_matrix = self.__intensity_matrix
+        self.__tic = None
+        self.data_stamp = self.__new_stamp()
 
 ## get_ms_at_time()
 
@@ -1394,7 +1515,8 @@ class IonChromatogram(object):
         if not isinstance(ia, numpy.ndarray):
             error("'ia' must be a numpy array")
 
-        if not is_list(time_list) or not is_number(time_list[0]):
+        if not is_list(time_list) or \
+           (not is_array(time_list) and not is_number(time_list[0])):
             error("'time_list' must be a list of numbers")
 
         if len(ia) != len(time_list):
@@ -1402,6 +1524,7 @@ class IonChromatogram(object):
 
         self.__ia = ia
         self.__time_list = time_list
+        self.__time_arr = numpy.asarray(time_list)
         self.__mass = mass
         self.__time_step = self.__calc_time_step(time_list)
         self.__min_rt = min(time_list)
@@ -1430,9 +1553,10 @@ class IonChromatogram(object):
         """
         
         ia_for_sub = Other.get_intensity_array()
-        
-        for i in range(self.__ia.size):
-            self.__ia[i] = self.__ia[i] - ia_for_sub[i]
+
+        # rebind rather than subtract in place, as the intensity array
+        # may be a view on an intensity data matrix
+        self.__ia = self.__ia - numpy.asarray(ia_for_sub)
             
 
     def get_intensity_at_index(self, ix):
@@ -1554,12 +1678,7 @@ class IonChromatogram(object):
         @author: Vladimir Likic
         """
 
-        td_list = []
-        for ii in range(len(time_list)-1):
-            td = time_list[ii+1]-time_list[ii]
-            td_list.append(td)
-
-        td_array = numpy.array(td_list)
+        td_array = numpy.diff(numpy.asarray(time_list))
         time_step = td_array.mean()
 
         return time_step
@@ -1588,18 +1707,20 @@ class IonChromatogram(object):
             error("time %.2f is out of bounds (min: %.2f, max: %.2f)" %
                   (time, self.__min_rt, self.__max_rt))
 
-        time_list = self.__time_list
-        time_diff_min = self.__max_rt
-        ix_match = None
-
-        for ix in range(len(time_list)):
-
-
-            time_diff = math.fabs(time-time_list[ix])
-
-            if time_diff < time_diff_min:
-                ix_match = ix
-                time_diff_min = time_diff
+        # retention times are monotonically increasing, so a binary
+        # search finds the insertion point and the nearest index is
+        # one of its two neighbours
+        time_arr = self.__time_arr
+        ix = int(numpy.searchsorted(time_arr, time))
+
+        if ix == 0:
+            ix_match = 0
+        elif ix == len(time_arr):
+            ix_match = len(time_arr)-1
+        elif time-time_arr[ix-1] <= time_arr[ix]-time:
+            ix_match = ix-1
+        else:
+            ix_match = ix
 
         return ix_match
 
@@ -1662,14 +1783,17 @@ class IonChromatogram(object):
 
         fp = open_for_writing(file_name)
 
-        time_list = copy.deepcopy(self.__time_list)
+        time_arr = numpy.asarray(self.__time_list, dtype=numpy.float64)
 
         if minutes:
-            for ii in range(len(time_list)):
-                time_list[ii] = time_list[ii]/60.0
-
-        for ii in range(len(time_list)):
-            fp.write("%8.4f %#.6e\n" % (time_list[ii], self.__ia[ii]))
+            time_arr = time_arr/60.0
+
+        # build the whole file in memory and flush it with one write,
+        # rather than one write per row
+        rows = [ "%8.4f %#.6e" % (time_arr[ii], self.__ia[ii]) \
+            for ii in range(time_arr.size) ]
+        fp.write("\n".join(rows))
+        fp.write("\n")
 
         close_for_writing(fp)
 
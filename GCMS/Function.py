@@ -24,18 +24,20 @@ Provides conversion and information functions for GC-MS data objects
 
 import math, sys
 
+import numpy
+
 from pyms.Utils.Error import error
 from pyms.Utils.Utils import is_number, is_str, is_array, is_list, is_int
 from pyms.GCMS.Class import GCMS_data, IntensityMatrix, IonChromatogram
 from pyms.Utils.Time import time_str_secs
 from pyms.Utils.Math import rmsd
 
-# If psyco is installed, use it to speed up running time
+# If numba is installed, use it to compile the per-scan binning loop
+# in __fill_bins() to native code (see below)
 try:
-    import psyco
-    psyco.full()
-except:
-    pass
+    from numba import njit
+except ImportError:
+    njit = None
 
 def build_intensity_matrix(data, bin_interval=1, bin_left=0.5, bin_right=0.5):
 
@@ -165,8 +167,8 @@ def __fill_bins(data, min_mass, max_mass, bin_interval, bin_left, bin_right):
     # Number of bins
     num_bins = int(float(max_mass+bl-min_mass)/bin_interval)+1
 
-    # initialise masses to bin centres
-    mass_list = [i * bin_interval + min_mass for i in xrange(num_bins)]
+    # initialise masses to bin centres, filled at C level
+    mass_list = (numpy.arange(num_bins)*bin_interval + min_mass).tolist()
 
     # Modified binning loops. I've replaced the deepcopy getting routines with
     # the alias properties. This way we can avoid performing the copies when
@@ -175,18 +177,58 @@ def __fill_bins(data, min_mass, max_mass, bin_interval, bin_left, bin_right):
     #           - Luke Hodkinson, 18/05/2010
 
     # fill the bins
-    intensity_matrix = []
-    for scan in data.scan_list: # use the alias, not the copy (Luke)
-        intensity_list = [0.0] * num_bins
+    # one preallocated matrix rather than a freshly zeroed list per
+    # scan, so the only allocation is the final buffer itself
+    scan_list = data.scan_list # use the alias, not the copy (Luke)
+    # float32 and column-major to match the IntensityMatrix storage
+    # exactly, so the constructor adopts the buffer without a final
+    # conversion copy
+    intensity_matrix = numpy.zeros((len(scan_list), num_bins),
+        dtype=numpy.float32, order='F')
+    for jj in xrange(len(scan_list)):
+        scan = scan_list[jj]
         masses = scan.mass_list # use the alias, not the copy (Luke)
         intensities = scan.intensity_list # use the alias, not the copy (Luke)
-        for ii in xrange(len(masses)):
-            mm = int((masses[ii] + bl - min_mass)/bin_interval)
-            intensity_list[mm] += intensities[ii]
-        intensity_matrix.append(intensity_list)
+        if njit is not None:
+            # the compiled loop wants typed arrays, not lists
+            masses = numpy.asarray(masses)
+            intensities = numpy.asarray(intensities)
+        __bin_scan(masses, intensities, bl, min_mass, bin_interval,
+            intensity_matrix[jj])
 
     return IntensityMatrix(data.get_time_list(), mass_list, intensity_matrix)
 
+def __bin_scan(masses, intensities, bl, min_mass, bin_interval, intensity_row):
+
+    """
+    @summary: Accumulates one scan's intensities into its matrix row
+
+    Kept as a separate function of plain arrays and scalars so it can
+    be compiled to native code by numba when available.
+
+    @param masses: Mass values of the scan
+    @type masses: ListType or numpy.ndarray
+    @param intensities: Intensity values of the scan
+    @type intensities: ListType or numpy.ndarray
+    @param bl: left bin boundary offset, reduced to < 1
+    @type bl: FloatType
+    @param min_mass: minimum mass value
+    @type min_mass: IntType or FloatType
+    @param bin_interval: interval between bin centres
+    @type bin_interval: IntType or FloatType
+    @param intensity_row: Matrix row to accumulate into
+    @type intensity_row: numpy.ndarray
+
+    @author: Andrew Isaac
+    """
+
+    for ii in range(len(masses)):
+        mm = int((masses[ii] + bl - min_mass)/bin_interval)
+        intensity_row[mm] += intensities[ii]
+
+if njit is not None:
+    __bin_scan = njit(cache=True)(__bin_scan)
+
 def __fill_bins_old(data, min_mass, max_mass, bin_interval, bin_left, bin_right):
 
     """
@@ -63,39 +63,29 @@ def ANDI_reader(file_name):
 
     print " -> Reading netCDF file '%s'" % (file_name)
 
-    scan_list = []
     mass = file.var(__MASS_STRING)
     intensity = file.var(__INTENSITY_STRING)
-    mass_values = mass.get().tolist()
-    mass_list = []
-    mass_previous = mass_values[0]
-    mass_list.append(mass_previous)
-    intensity_values = intensity.get().tolist()
-    intensity_list = []
-    intensity_previous = intensity_values[0]
-    intensity_list.append(intensity_previous)
+    # keep the point data as numpy arrays rather than boxing every
+    # sample into a Python float. float64, so single elements behave
+    # as plain Python floats downstream
+    mass_values = mass.get().astype(numpy.float64)
+    intensity_values = intensity.get().astype(numpy.float64)
     if not len(mass_values) == len(intensity_values):
         error("length of mass_list is not equal to length of intensity_list !")
-    for i in range(len(mass_values) - 1):
-        # assume masses in ascending order until new scan
-        if mass_previous <= mass_values[i + 1]:
-            #print mass_values[i+1]
-            mass_list.append(mass_values[i + 1])
-            mass_previous = mass_values[i + 1]
-            intensity_list.append(intensity_values[i + 1])
-            intensity_previous = intensity_values[i + 1]
-        # new scan
-        else:
-            scan_list.append(Scan(mass_list, intensity_list))
-            #print "Added scan"
-            mass_previous = mass_values[i + 1]
-            intensity_previous = intensity_values[i + 1]
-            mass_list = []
-            intensity_list = []
-            mass_list.append(mass_previous)
-            intensity_list.append(intensity_previous)
-    # store final scan
-    scan_list.append(Scan(mass_list, intensity_list))
+
+    # scans are stored back to back with masses in ascending order
+    # within each scan, so a drop in mass marks the start of a new
+    # scan. Find all boundaries in one vectorised pass
+    boundaries = numpy.flatnonzero(numpy.diff(mass_values) < 0) + 1
+
+    # cut the point arrays into one segment (a view, not a copy) per
+    # scan
+    mass_segs = numpy.split(mass_values, boundaries)
+    intensity_segs = numpy.split(intensity_values, boundaries)
+
+    scan_list = []
+    for ii in range(len(mass_segs)):
+        scan_list.append(Scan(mass_segs[ii], intensity_segs[ii]))
     time = file.var(__TIME_STRING)
     time_list = time.get().tolist()
 
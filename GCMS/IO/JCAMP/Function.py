@@ -45,7 +45,12 @@ def JCAMP_reader(file_name):
         error("'file_name' not a string")
 
     print " -> Reading JCAMP file '%s'" % (file_name)
-    lines_list = open(file_name,'r')
+    # slurp the file with one read and parse in memory, rather than
+    # issuing a buffered read per line; also closes the file, which
+    # was previously left open
+    fp = open(file_name,'r')
+    lines_list = fp.read().splitlines()
+    fp.close()
     data = []
     page_idx = 0
     xydata_idx = 0
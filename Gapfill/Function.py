@@ -304,16 +304,19 @@ def write_filled_csv(sample_list, area_file, filled_area_file):
     
 
     fp_new = open(filled_area_file, 'w')
- 
-            
+
+
     #    new_matrix = numpy.empty(matrix_size)
     new_matrix = transposed(invert_new_matrix)
 
-    for i, line in enumerate(new_matrix):
-        for j, part in enumerate(line):
-            fp_new.write(str(part) +',')
-        fp_new.write("\n")
-            
+    # format each row in memory and flush the whole table with a
+    # single write, instead of one write per cell
+    rows = []
+    for line in new_matrix:
+        rows.append("".join([ str(part) + ',' for part in line ]))
+    fp_new.write("\n".join(rows))
+    fp_new.write("\n")
+
     fp_new.close()
         
                 
@@ -121,7 +121,9 @@ def __mean_window(ia, wing_length):
 
 #print " -> Window smoothing (mean): the wing is %d point(s)" % (wing_length)
 
-    ia_denoise = numpy.repeat([0], ia.size)
+    # float output buffer; an integer buffer here would silently
+    # truncate the smoothed values
+    ia_denoise = numpy.zeros(ia.size)
 
     index = 0
     end = ia.size - 1
@@ -155,7 +157,9 @@ def __median_window(ia, wing_length):
 
 #print " -> Window smoothing (median): the wing is %d point(s)" % (wing_length)
 
-    ia_denoise = numpy.repeat([0], ia.size)
+    # float output buffer; an integer buffer here would silently
+    # truncate the smoothed values
+    ia_denoise = numpy.zeros(ia.size)
 
     index = 0
     end = ia.size - 1
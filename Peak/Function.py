@@ -28,15 +28,66 @@ import copy
 #from pyms.Utils.Error import error
 from pyms.Peak.Class import Peak
 from pyms.Utils.Utils import is_str, is_list
-from pyms.Utils.Math import median
 from pyms.GCMS.Class import MassSpectrum
 
-# If psyco is installed, use it to speed up running time
+# If numba is installed, use it to compile the boundary-search loop
+# in half_area() to native code (see below)
 try:
-    import psyco
-    psyco.full()
-except:
-    pass
+    from numba import njit
+except ImportError:
+    njit = None
+
+def __ion_areas(im, peak, apex, max_bound):
+
+    """
+    @summary: Returns the apexing mass indices of a peak and the
+        ion_area() result for each, caching the results
+
+    The results are stored on the Peak itself, keyed on the matrix
+    data revision stamp, the apex index and the bound limit. The
+    cache therefore lives and dies with the peak, and a stale entry
+    can never be served: any modification of the intensity data
+    matrix (set_ic_at_index, null_mass, crop_mass,
+    reduce_mass_spectra, import_leco_csv) takes a fresh stamp and
+    the key no longer matches.
+
+    @param im: The originating IntensityMatrix object
+    @type im: pyms.GCMS.Class.IntensityMatrix
+    @param peak: The Peak object
+    @type peak: pyms.Peak.Class.Peak
+    @param apex: Index of the peak apex
+    @type apex: IntType
+    @param max_bound: Optional value to limit size of detected bound
+    @type max_bound: IntType
+
+    @return: Indices of apexing masses, and list of ion_area() tuples
+    @rtype: TupleType
+
+    @author: Andrew Isaac
+    """
+
+    key = (im.data_stamp, apex, max_bound)
+    cached = getattr(peak, '_ion_area_cache', None)
+    if cached is not None and cached[0] == key:
+        return cached[1], cached[2]
+
+    # Use internal values (not copy)
+    mat = im.intensity_matrix
+    ms = peak.get_mass_spectrum()
+
+    # get peak masses with non-zero intensity
+    mass_ii = numpy.nonzero(numpy.asarray(ms.mass_spec) > 0)[0]
+
+    # gather all needed ion chromatograms in one step
+    cols = mat[:,mass_ii]
+
+    areas = []
+    for kk in range(cols.shape[1]):
+        areas.append(ion_area(cols[:,kk], apex, max_bound))
+
+    peak._ion_area_cache = (key, mass_ii, areas)
+
+    return mass_ii, areas
 
 def peak_sum_area(im, peak, single_ion=False, max_bound=0):
 
@@ -61,25 +112,18 @@ def peak_sum_area(im, peak, single_ion=False, max_bound=0):
     """
 
     sum_area = 0
-    # Use internal values (not copy)
-    #mat = im.get_matrix_list()
-    mat = im.intensity_matrix
     ms = peak.get_mass_spectrum()
     rt = peak.get_rt()
     apex = im.get_index_at_time(rt)
 
-    # get peak masses with non-zero intensity
-    mass_ii = [ ii for ii in xrange(len(ms.mass_list)) \
-        if ms.mass_spec[ii] > 0 ]
+    mass_ii, areas = __ion_areas(im, peak, apex, max_bound)
 
     area_dict = {}
     # get stats on boundaries
-    for ii in mass_ii:
-        # get ion chromatogram as list
-        ia = [ mat[scan][ii] for scan in xrange(len(mat)) ]
-        area, left, right, l_share, r_share = ion_area(ia, apex, max_bound)
+    for kk in range(len(areas)):
+        area, left, right, l_share, r_share = areas[kk]
         # need actual mass for single ion areas
-        actual_mass = ms.mass_list[ii]
+        actual_mass = ms.mass_list[mass_ii[kk]]
         area_dict[actual_mass] = area
         sum_area += area
 
@@ -88,6 +132,63 @@ def peak_sum_area(im, peak, single_ion=False, max_bound=0):
     else:
         return sum_area
 
+def peak_stats(im, peak, max_bound=0, shared=True):
+
+    """
+    @Summary: Calculate the sum of the raw ion areas and the median of
+        the left and right boundaries in a single pass
+
+    Equivalent to calling peak_sum_area() and median_bounds() for the
+    same peak, but the apexing masses are found and their ion
+    chromatograms gathered only once.
+
+    @param im: The originating IntensityMatrix object
+    @type im: pyms.GCMS.Class.IntensityMatrix
+    @param peak: The Peak object
+    @type peak: pyms.Peak.Class.Peak
+    @param max_bound: Optional value to limit size of detected bound
+    @type max_bound: IntType
+    @param shared: Include shared ions shared with neighbouring peak
+    @type shared: BooleanType
+
+    @return: Sum of peak apex ions in detected bounds, and median left
+        and right boundary offset in points
+    @rtype: TupleType
+
+    @author: Andrew Isaac
+    @author: Sean O'Callaghan
+    """
+
+    rt = peak.get_rt()
+    apex = im.get_index_at_time(rt)
+    # check if RT based index is simmilar to stored index
+    tmp = peak.get_pt_bounds()
+    if is_list(tmp) and apex-1 < tmp[1] and tmp[1] < apex+1:
+        apex = tmp[1]
+
+    mass_ii, areas = __ion_areas(im, peak, apex, max_bound)
+
+    sum_area = 0
+    left_list = []
+    right_list = []
+    for kk in range(len(areas)):
+        area, left, right, l_share, r_share = areas[kk]
+        sum_area += area
+        if shared or not l_share:
+            left_list.append(left)
+        if shared or not r_share:
+            right_list.append(right)
+
+    # NB if shared=True, lists maybe empty
+    l_med = 0
+    r_med = 0
+    if len(left_list) > 0:
+        l_med = numpy.median(left_list)
+    if len(right_list) > 0:
+        r_med = numpy.median(right_list)
+
+    return sum_area, l_med, r_med
+
 def peak_top_ion_areas(im, peak, n_top_ions = 5, max_bound=0):
     """
     @summary: Calculate and return the ion areas of the five most
@@ -116,8 +217,7 @@ def peak_top_ion_areas(im, peak, n_top_ions = 5, max_bound=0):
 
     for ion in top_ions:
         ion_chrom = im.get_ic_at_mass(ion)
-        # need ia as a list not numpy array so use .tolist()
-        ia = ion_chrom.get_intensity_array().tolist()
+        ia = ion_chrom.get_intensity_array()
         area, left, right, l_share, r_share = ion_area(ia, apex, max_bound)
         # need actual mass for single ion areas
         ion_areas[ion] = area
@@ -210,14 +310,17 @@ def ion_area(ia, apex, max_bound=0, tol=0.5):
     @author: Andrew Isaac
     """
 
+    ia = numpy.asarray(ia, dtype=numpy.float64)
+
+    tol = tol/200.0  # halve and convert from percent
+
     # Left area
-    lhs = ia[:apex+1]
-    lhs.reverse()  # reverse, as search to right is bounds safe
-    l_area, left, l_share = half_area(lhs, max_bound, tol)
+    lhs = ia[:apex+1][::-1]  # reversed view, as search to right is bounds safe
+    l_area, left, l_share = __half_area(lhs, max_bound, tol)
 
     # Right area
     rhs = ia[apex:]
-    r_area, right, r_share = half_area(rhs, max_bound, tol)
+    r_area, right, r_share = __half_area(rhs, max_bound, tol)
     r_area -= ia[apex]  # counted apex twice for tollerence, now ignore
 
     # Put it all together
@@ -244,9 +347,74 @@ def half_area(ia, max_bound=0, tol=0.5):
 
     tol = tol/200.0  # halve and convert from percent
 
+    ia = numpy.asarray(ia, dtype=numpy.float64)
+
+    return __half_area(ia, max_bound, tol)
+
+def __half_area(ia, max_bound, tol):
+
+    """
+    @summary: Core of half_area(), taking an ndarray and a
+        pre-converted fractional tolerance
+
+    Called directly by ion_area() for each half of the peak so the
+    percent conversion and list-to-array conversion are done once per
+    peak, not once per half.
+
+    @param ia: Intensities from Peak apex for a given mass
+    @type ia: numpy.ndarray
+    @param max_bound: Optional value to limit size of detected bound
+    @type max_bound: IntType
+    @param tol: Fractional tolerance of added area to current area.
+    @type tol: FloatType
+
+    @return: Half peak area, boundary offset, shared (True if shared ion)
+    @rtype: TupleType
+
+    @author: Andrew Isaac
+    """
+
     # Default number of points to sum new area across, for smoothing
     wide = 3
 
+    n = len(ia)
+
+    # prefix sums make each 'wide'-point edge sum an O(1) lookup
+    # instead of a fresh slice sum per step
+    csum = numpy.concatenate(([0.0], numpy.cumsum(ia)))
+
+    if max_bound < 1:
+        limit = n
+    else:
+        limit = min(max_bound+1, n)
+
+    return __half_area_loop(ia, csum, tol, wide, limit)
+
+def __half_area_loop(ia, csum, tol, wide, limit):
+
+    """
+    @summary: Scalar boundary-search loop of half_area()
+
+    Kept as a separate function of plain arrays and scalars so it can
+    be compiled to native code by numba when available.
+
+    @param ia: Intensities from Peak apex for a given mass
+    @type ia: numpy.ndarray
+    @param csum: Prefix sums of 'ia', with a leading zero
+    @type csum: numpy.ndarray
+    @param tol: Fractional tolerance of added area to current area.
+    @type tol: FloatType
+    @param wide: Number of points in the edge window
+    @type wide: IntType
+    @param limit: Maximum boundary offset to search
+    @type limit: IntType
+
+    @return: Half peak area, boundary offset, shared (True if shared ion)
+    @rtype: TupleType
+
+    @author: Andrew Isaac
+    """
+
     # start at 0, compare average value of 'wide' points to the right,
     # centre 'wide' points on edge point,
     # and keep moving right until:
@@ -256,19 +424,16 @@ def half_area(ia, max_bound=0, tol=0.5):
 
     #
     # initialise areas and bounds
+    n = ia.shape[0]
     shared = False
     area = ia[0]
-    edge = float(sum(ia[0:wide]))/wide
+    edge = (csum[min(wide, n)]-csum[0])/wide
     old_edge = 2 * edge  # bigger than expected edge
     index = 1
-    if max_bound < 1:
-        limit = len(ia)
-    else:
-        limit = min(max_bound+1, len(ia))
     while edge > area * tol and edge < old_edge and index < limit:
         old_edge = edge
         area += ia[index]
-        edge = float(sum(ia[index:index+wide]))/wide  # bounds safe
+        edge = (csum[min(index+wide, n)]-csum[index])/wide  # bounds safe
         index += 1
     if edge >= old_edge:
         shared = True
@@ -276,6 +441,9 @@ def half_area(ia, max_bound=0, tol=0.5):
 
     return area, index, shared
 
+if njit is not None:
+    __half_area_loop = njit(cache=True)(__half_area_loop)
+
 def median_bounds(im, peak, shared=True):
 
     """
@@ -295,8 +463,6 @@ def median_bounds(im, peak, shared=True):
     @author: Andrew Isaac
     """
 
-    mat = im.get_matrix_list()
-    ms = peak.get_mass_spectrum()
     rt = peak.get_rt()
     apex = im.get_index_at_time(rt)
     # check if RT based index is simmilar to stored index
@@ -304,17 +470,13 @@ def median_bounds(im, peak, shared=True):
     if is_list(tmp) and apex-1 < tmp[1] and tmp[1] < apex+1:
         apex = tmp[1]
 
-    # get peak masses with non-zero intensity
-    mass_ii = [ ii for ii in xrange(len(ms.mass_list)) \
-        if ms.mass_spec[ii] > 0 ]
+    mass_ii, areas = __ion_areas(im, peak, apex, 0)
 
     # get stats on boundaries
     left_list = []
     right_list = []
-    for ii in mass_ii:
-        # get ion chromatogram as list
-        ia = [ mat[scan][ii] for scan in xrange(len(mat)) ]
-        area, left, right, l_share, r_share = ion_area(ia, apex)
+    for kk in range(len(areas)):
+        area, left, right, l_share, r_share = areas[kk]
         if shared or not l_share:
             left_list.append(left)
         if shared or not r_share:
@@ -325,8 +487,8 @@ def median_bounds(im, peak, shared=True):
     l_med = 0
     r_med = 0
     if len(left_list) > 0:
-        l_med = median(left_list)
+        l_med = numpy.median(left_list)
     if len(right_list) > 0:
-        r_med = median(right_list)
+        r_med = numpy.median(right_list)
 
     return l_med, r_med
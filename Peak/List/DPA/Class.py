@@ -36,13 +36,6 @@ from pyms.Peak.List.Function import composite_peak
 import Function
 import Function_new
 
-# If psyco is installed, use it to speed up running time
-try:
-    import psyco
-    psyco.full()
-except:
-    pass
-
 class Alignment(object):
 
     """
@@ -35,13 +35,6 @@ from pyms.Experiment.Class import Experiment
 import Class
 import Utils
 
-# If psyco is installed, use it to speed up running time
-try:
-    import psyco
-    psyco.full()
-except:
-    pass
-
 def align_with_tree(T, min_peaks=1):
 
     """
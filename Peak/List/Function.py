@@ -30,13 +30,6 @@ from pyms.Utils.Utils import is_str, is_list
 from pyms.Utils.Math import median
 from pyms.GCMS.Class import MassSpectrum
 
-# If psyco is installed, use it to speed up running time
-try:
-    import psyco
-    psyco.full()
-except:
-    pass
-
 def composite_peak(peak_list, minutes=False):
 
     """
@@ -169,21 +169,11 @@ def file_lines(file_name, filter=False):
     close_for_reading(fp)
 
     if filter:
-        # strip leading and talining whitespaces
-        lines_filtered = []
-        for line in lines:
-            line = line.strip()
-            lines_filtered.append(line)
-
-        # discard comments
-        lines_to_discard = []
-        for line in lines_filtered:
-            # remove empty lines and comments
-            if len(line) == 0 or line[0] == "#":
-                lines_to_discard.append(line)
-        for line in lines_to_discard:
-            lines_filtered.remove(line)
-        lines = lines_filtered
+        # strip leading and trailing whitespaces, then discard empty
+        # lines and comments, in a single pass
+        lines = [ line.strip() for line in lines ]
+        lines = [ line for line in lines \
+            if len(line) > 0 and line[0] != "#" ]
 
     return lines
 
@@ -22,7 +22,9 @@ Provides mathematical functions
  #                                                                           #
  #############################################################################
 
-import copy, math
+import math
+
+import numpy
 
 from pyms.Utils.Error import error
 from pyms.Utils.Utils import is_list, is_number
@@ -43,20 +45,9 @@ def median(v):
     if not is_list(v):
         error("argument neither list nor array")
 
-    local_data = copy.deepcopy(v)
-    local_data.sort()
-    N = len(local_data)
-
-    if (N % 2) == 0:
-        # even number of points
-        K = N/2 - 1 
-        median = (local_data[K] + local_data[K+1])/2.0
-    else:
-	    # odd number of points
-        K = (N - 1)/2 - 1
-        median = local_data[K+1]
-
-    return median
+    # sorts and averages the middle elements at C level, leaving the
+    # input untouched
+    return float(numpy.median(numpy.asarray(v)))
 
 def vector_by_step(vstart,vstop,vstep):
 
@@ -105,14 +96,9 @@ def MAD(v):
     if not is_list(v):
         error("argument neither list nor array")
 
-    m = median(v)
-    m_list = []
-
-    for xi in v:
-        d = math.fabs(xi - m)
-        m_list.append(d)
-
-    mad = median(m_list)/0.6745
+    arr = numpy.asarray(v)
+    m = numpy.median(arr)
+    mad = float(numpy.median(numpy.fabs(arr - m)))/0.6745
 
     return mad
 
@@ -164,12 +150,7 @@ def mean(v):
     if not is_list(v):
         error("argument neither list nor array")
 
-    s = 0.0
-    for e in v:
-        s = s + e 
-    s_mean = s/float(len(v))
-
-    return s_mean
+    return float(numpy.mean(numpy.asarray(v)))
 
 def std(v):
 
@@ -188,16 +169,8 @@ def std(v):
     if not is_list(v):
         error("argument neither list nor array")
 
-    v_mean = mean(v)
-
-    s = 0.0 
-    for e in v:
-        d = e - v_mean
-        s = s + d*d
-    s_mean = s/float(len(v)-1)
-    v_std = math.sqrt(s_mean)
-
-    return v_std
+    # sample standard deviation, as before
+    return float(numpy.std(numpy.asarray(v), ddof=1))
 
 
 def rmsd(list1, list2):
@@ -223,9 +196,7 @@ def rmsd(list1, list2):
     if not is_list(list2):
         error("argument neither list nor array")
 
-    sum = 0.0
-    for i in range(len(list1)):
-        sum = sum + (list1[i] - list2[i]) ** 2
-    rmsd = math.sqrt(sum / len(list1))
+    diff = numpy.asarray(list1) - numpy.asarray(list2)
+    rmsd = math.sqrt(numpy.mean(diff*diff))
     return rmsd
 